@@ -11,6 +11,15 @@ struct HexApp: App {
 	}
 
 	@NSApplicationDelegateAdaptor(HexAppDelegate.self) var appDelegate
+
+	/// Sized once rather than on every evaluation of the menu bar label.
+	private static let menuBarIcon: NSImage = {
+		let image = NSImage(named: "HexIcon")!.copy() as! NSImage
+		let ratio = image.size.height / image.size.width
+		image.size.height = 18
+		image.size.width = 18 / ratio
+		return image
+	}()
   
     var body: some Scene {
         MenuBarExtra {
@@ -29,13 +38,7 @@ struct HexApp: App {
 				NSApplication.shared.terminate(nil)
 			}.keyboardShortcut("q")
 		} label: {
-			let image: NSImage = {
-				let ratio = $0.size.height / $0.size.width
-				$0.size.height = 18
-				$0.size.width = 18 / ratio
-				return $0
-			}(NSImage(named: "HexIcon")!)
-			Image(nsImage: image)
+			Image(nsImage: Self.menuBarIcon)
 		}
 
 
@@ -58,13 +58,7 @@ class HexAppDelegate: NSObject, NSApplicationDelegate {
 	/// Application Support folder, keeping everything in one place.
     private func configureLocalCaches() {
         do {
-            let support = try FileManager.default.url(
-                for: .applicationSupportDirectory,
-                in: .userDomainMask,
-                appropriateFor: nil,
-                create: true
-            )
-            let cache = support.appendingPathComponent("com.kitlangton.Hex/cache", isDirectory: true)
+            let cache = try URL.hexApplicationSupport.appendingPathComponent("cache", isDirectory: true)
             try FileManager.default.createDirectory(at: cache, withIntermediateDirectories: true)
             setenv("XDG_CACHE_HOME", cache.path, 1)
             cacheLogger.info("XDG_CACHE_HOME set to \(cache.path)")
@@ -109,19 +103,20 @@ class HexAppDelegate: NSObject, NSApplicationDelegate {
 	}
 
 	@objc private func handleAppModeUpdate() {
-		Task {
-			await updateAppMode()
+		// The notification is only posted from the main actor, so apply the change
+		// synchronously on the main run loop instead of scheduling another Task hop.
+		MainActor.assumeIsolated {
+			updateAppMode()
 		}
 	}
 
 	@MainActor
 	private func updateAppMode() {
+		let policy: NSApplication.ActivationPolicy = hexSettings.showDockIcon ? .regular : .accessory
+		// Settings bindings post this for every edit, most of which don't touch the dock icon.
+		guard NSApp.activationPolicy() != policy else { return }
 		appLogger.debug("showDockIcon = \(self.hexSettings.showDockIcon)")
-		if self.hexSettings.showDockIcon {
-			NSApp.setActivationPolicy(.regular)
-		} else {
-			NSApp.setActivationPolicy(.accessory)
-		}
+		NSApp.setActivationPolicy(policy)
 	}
 
 	func applicationShouldHandleReopen(_: NSApplication, hasVisibleWindows _: Bool) -> Bool {
@@ -129,9 +124,34 @@ class HexAppDelegate: NSObject, NSApplicationDelegate {
 		return true
 	}
 
-	func applicationWillTerminate(_: Notification) {
-		Task {
-			await recording.cleanup()
+	func applicationShouldTerminate(_ sender: NSApplication) -> NSApplication.TerminateReply {
+		// A fire-and-forget Task in applicationWillTerminate never gets to run before
+		// the process exits, so hold termination until the recorder has released the
+		// input device, but never for longer than the shutdown timeout.
+		let recording = self.recording
+		let timeout = Self.shutdownTimeout
+		Task { @MainActor in
+			await withTaskGroup(of: Bool.self) { group in
+				group.addTask {
+					await recording.cleanup()
+					return true
+				}
+				group.addTask {
+					try? await Task.sleep(for: timeout)
+					return false
+				}
+				// Reply as soon as either child finishes; the group still drains a
+				// slow cleanup afterwards, but termination no longer waits on it.
+				let cleanedUp = await group.next() ?? false
+				if !cleanedUp {
+					appLogger.error("Recorder cleanup timed out; terminating anyway")
+				}
+				sender.reply(toApplicationShouldTerminate: true)
+				group.cancelAll()
+			}
 		}
+		return .terminateLater
 	}
+
+	private static let shutdownTimeout: Duration = .seconds(2)
 }
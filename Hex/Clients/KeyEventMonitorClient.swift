@@ -10,6 +10,7 @@ import HexCore
 import IOKit
 import IOKit.hidsystem
 import Sauce
+import Synchronization
 
 private let logger = HexLog.keyEvent
 
@@ -28,7 +29,7 @@ struct KeyEventMonitorToken: Sendable {
 }
 
 public extension KeyEvent {
-  init(cgEvent: CGEvent, type: CGEventType, isFnPressed: Bool) {
+  init(cgEvent: CGEvent, type: CGEventType, modifiers: Modifiers) {
     let keyCode = Int(cgEvent.getIntegerValueField(.keyboardEventKeycode))
     // Accessing keyboard layout / input source via Sauce must be on main thread.
     let key: Key?
@@ -42,10 +43,6 @@ public extension KeyEvent {
       key = nil
     }
 
-    var modifiers = Modifiers.from(carbonFlags: cgEvent.flags)
-    if !isFnPressed {
-      modifiers = modifiers.removing(kind: .fn)
-    }
     self.init(key: key, modifiers: modifiers)
   }
 }
@@ -90,21 +87,50 @@ extension DependencyValues {
 }
 
 class KeyEventMonitorClientLive {
+  private struct TapState {
+    var keyHandlers: [@Sendable (KeyEvent) -> Bool] = []
+    var inputHandlers: [@Sendable (InputEvent) -> Bool] = []
+    var hasRequiredPermissions = false
+  }
+
   private var eventTapPort: CFMachPort?
   private var runLoopSource: CFRunLoopSource?
-  private var continuations: [UUID: @Sendable (KeyEvent) -> Bool] = [:]
-  private var inputContinuations: [UUID: @Sendable (InputEvent) -> Bool] = [:]
+  private var continuations: [Int: @Sendable (KeyEvent) -> Bool] = [:] {
+    didSet {
+      let handlers = Array(continuations.values)
+      tapState.withLock { $0.keyHandlers = handlers }
+    }
+  }
+  private var inputContinuations: [Int: @Sendable (InputEvent) -> Bool] = [:] {
+    didSet {
+      let handlers = Array(inputContinuations.values)
+      tapState.withLock { $0.inputHandlers = handlers }
+    }
+  }
+  /// Everything the event tap reads per event, published whenever handlers or permissions
+  /// change. Mutations still go through `queue`; the tap only takes this unfair lock.
+  private let tapState = Mutex(TapState())
+  private let handlerIDs = Atomic<Int>(0)
   private let queue = DispatchQueue(label: "com.kitlangton.Hex.KeyEventMonitor", attributes: .concurrent)
   private var isMonitoring = false
   private var wantsMonitoring = false
-  private var accessibilityTrusted = false
-  private var inputMonitoringTrusted = false
+  private var accessibilityTrusted = false {
+    didSet { publishPermissions() }
+  }
+  private var inputMonitoringTrusted = false {
+    didSet { publishPermissions() }
+  }
   private var trustMonitorTask: Task<Void, Never>?
   private var isFnPressed = false
+  private var lastMouseClickUptime: UInt64 = 0
+  private var lastModifierFlags: CGEventFlags?
+  private var lastModifiers: Modifiers = []
   private var hasPromptedForAccessibilityTrust = false
   @Shared(.hotkeyPermissionState) private var hotkeyPermissionState: HotkeyPermissionState
 
   private let trustCheckIntervalNanoseconds: UInt64 = 100_000_000 // 100ms
+  private let mouseClickCoalesceNanoseconds: UInt64 = 5_000_000 // 5ms
+  private static let keyPressBufferLimit = 1024
 
   init() {
     logger.info("Initializing HotKeyClient with CGEvent tap.")
@@ -114,18 +140,18 @@ class KeyEventMonitorClientLive {
     self.stopMonitoring()
   }
 
-  private var hasRequiredPermissions: Bool {
-    queue.sync { accessibilityTrusted && inputMonitoringTrusted }
+  /// Handler IDs only need to be unique for cancellation, so a counter is enough.
+  private func nextHandlerID() -> Int {
+    handlerIDs.add(1, ordering: .relaxed).newValue
   }
 
-  private var hasHandlers: Bool {
-    queue.sync { !(continuations.isEmpty && inputContinuations.isEmpty) }
+  private func publishPermissions() {
+    let granted = accessibilityTrusted && inputMonitoringTrusted
+    tapState.withLock { $0.hasRequiredPermissions = granted }
   }
 
-  private func setMonitoringIntent(_ value: Bool) {
-    queue.async(flags: .barrier) { [weak self] in
-      self?.wantsMonitoring = value
-    }
+  private var hasHandlers: Bool {
+    queue.sync { !(continuations.isEmpty && inputContinuations.isEmpty) }
   }
 
   private func desiredMonitoringState() -> Bool {
@@ -138,125 +164,113 @@ class KeyEventMonitorClientLive {
   }
 
   /// Provide a stream of key events.
+  ///
+  /// The buffer is bounded so a stalled consumer can't grow it without limit; if it ever
+  /// falls that far behind, the oldest key events are dropped first.
   func listenForKeyPress() -> AsyncThrowingStream<KeyEvent, Error> {
-    AsyncThrowingStream { continuation in
-      let uuid = UUID()
+    AsyncThrowingStream(bufferingPolicy: .bufferingNewest(Self.keyPressBufferLimit)) { continuation in
+      let id = nextHandlerID()
 
-      queue.async(flags: .barrier) { [weak self] in
-        guard let self = self else { return }
-        self.continuations[uuid] = { event in
+      addHandler { live in
+        live.continuations[id] = { event in
           continuation.yield(event)
           return false
         }
-        let shouldStart = self.continuations.count == 1 && self.inputContinuations.isEmpty
-
-        // Start monitoring if this is the first subscription
-        if shouldStart {
-          self.startMonitoring()
-        }
       }
 
       // Cleanup on cancellation
       continuation.onTermination = { [weak self] _ in
-        self?.removeHandlerContinuation(uuid: uuid)
+        self?.removeHandlerContinuation(id: id)
       }
     }
   }
 
-  private func removeHandlerContinuation(uuid: UUID) {
+  private func removeHandlerContinuation(id: Int) {
+    removeHandler { live in live.continuations[id] = nil }
+  }
+
+  private func removeInputContinuation(id: Int) {
+    removeHandler { live in live.inputContinuations[id] = nil }
+  }
+
+  /// Installs a handler and, if it is the first one, records the monitoring intent in the
+  /// same barrier block so a concurrent removal always sees a consistent state.
+  private func addHandler(_ install: @escaping (KeyEventMonitorClientLive) -> Void) {
     queue.async(flags: .barrier) { [weak self] in
-      guard let self = self else { return }
-      self.continuations[uuid] = nil
-      if self.continuations.isEmpty && self.inputContinuations.isEmpty {
-        self.stopMonitoring()
+      guard let self else { return }
+      let wasEmpty = self.continuations.isEmpty && self.inputContinuations.isEmpty
+      install(self)
+      if wasEmpty {
+        self.beginMonitoringOnQueue()
       }
     }
   }
 
-  private func removeInputContinuation(uuid: UUID) {
+  private func removeHandler(_ uninstall: @escaping (KeyEventMonitorClientLive) -> Void) {
     queue.async(flags: .barrier) { [weak self] in
-      guard let self = self else { return }
-      self.inputContinuations[uuid] = nil
+      guard let self else { return }
+      uninstall(self)
       if self.continuations.isEmpty && self.inputContinuations.isEmpty {
-        self.stopMonitoring()
+        self.endMonitoringOnQueue()
       }
     }
   }
 
-  func startMonitoring() {
-    setMonitoringIntent(true)
-    startTrustMonitorIfNeeded()
+  /// Must run inside a barrier block on `queue`.
+  private func beginMonitoringOnQueue() {
+    wantsMonitoring = true
+    if trustMonitorTask == nil {
+      trustMonitorTask = Task { [weak self] in
+        await self?.watchPermissions()
+      }
+    }
     refreshTrustedFlag(promptIfUntrusted: true)
     Task { [weak self] in
       await self?.refreshMonitoringState(reason: "startMonitoring")
     }
   }
-  // TODO: Handle removing the handler from the continuations on deinit/cancellation
-  func handleKeyEvent(_ handler: @Sendable @escaping (KeyEvent) -> Bool) -> KeyEventMonitorToken {
-    let uuid = UUID()
-
-    queue.async(flags: .barrier) { [weak self] in
-      guard let self = self else { return }
-      self.continuations[uuid] = handler
-      let shouldStart = self.continuations.count == 1 && self.inputContinuations.isEmpty
-
-      if shouldStart {
-        self.startMonitoring()
-      }
-    }
 
-    return KeyEventMonitorToken { [weak self] in
-      self?.removeHandlerContinuation(uuid: uuid)
+  /// Must run inside a barrier block on `queue`.
+  private func endMonitoringOnQueue() {
+    wantsMonitoring = false
+    trustMonitorTask?.cancel()
+    trustMonitorTask = nil
+    Task { [weak self] in
+      await self?.refreshMonitoringState(reason: "stopMonitoring")
     }
   }
 
-  func handleInputEvent(_ handler: @Sendable @escaping (InputEvent) -> Bool) -> KeyEventMonitorToken {
-    let uuid = UUID()
-
+  func startMonitoring() {
     queue.async(flags: .barrier) { [weak self] in
-      guard let self = self else { return }
-      self.inputContinuations[uuid] = handler
-      let shouldStart = self.inputContinuations.count == 1 && self.continuations.isEmpty
-
-      if shouldStart {
-        self.startMonitoring()
-      }
+      self?.beginMonitoringOnQueue()
     }
+  }
+
+  // TODO: Handle removing the handler from the continuations on deinit/cancellation
+  func handleKeyEvent(_ handler: @Sendable @escaping (KeyEvent) -> Bool) -> KeyEventMonitorToken {
+    let id = nextHandlerID()
+    addHandler { live in live.continuations[id] = handler }
 
     return KeyEventMonitorToken { [weak self] in
-      self?.removeInputContinuation(uuid: uuid)
+      self?.removeHandlerContinuation(id: id)
     }
   }
 
-  func stopMonitoring() {
-    setMonitoringIntent(false)
-    Task { [weak self] in
-      await self?.refreshMonitoringState(reason: "stopMonitoring")
-    }
-    cancelTrustMonitorIfNeeded()
-  }
+  func handleInputEvent(_ handler: @Sendable @escaping (InputEvent) -> Bool) -> KeyEventMonitorToken {
+    let id = nextHandlerID()
+    addHandler { live in live.inputContinuations[id] = handler }
 
-  private func startTrustMonitorIfNeeded() {
-    queue.async(flags: .barrier) { [weak self] in
-      guard let self else { return }
-      guard self.trustMonitorTask == nil else { return }
-      self.trustMonitorTask = Task { [weak self] in
-        await self?.watchPermissions()
-      }
+    return KeyEventMonitorToken { [weak self] in
+      self?.removeInputContinuation(id: id)
     }
   }
 
-  private func cancelTrustMonitorIfNeeded() {
+  func stopMonitoring() {
     queue.async(flags: .barrier) { [weak self] in
-      guard let self else { return }
-      guard !self.wantsMonitoring else { return }
-      self.trustMonitorTask?.cancel()
-      self.trustMonitorTask = nil
+      self?.endMonitoringOnQueue()
     }
   }
 
-  // no separate helper; handled inline above
-
   private func watchPermissions() async {
     var last = (
       accessibility: currentAccessibilityTrust(),
@@ -353,8 +367,11 @@ class KeyEventMonitorClientLive {
     guard !isMonitoring else { return }
     guard hasHandlers else { return }
 
-    let accessibilityTrusted = currentAccessibilityTrust()
-    let inputMonitoringTrusted = currentInputMonitoringTrust()
+    // The permission watchdog revokes cached grants within one poll interval, so a
+    // flag that is already true doesn't need another TCC round trip here.
+    let cached = queue.sync { (accessibility: self.accessibilityTrusted, input: self.inputMonitoringTrusted) }
+    let accessibilityTrusted = cached.accessibility || currentAccessibilityTrust()
+    let inputMonitoringTrusted = cached.input || currentInputMonitoringTrust()
     setPermissionFlags(accessibility: accessibilityTrusted, input: inputMonitoringTrusted)
     guard accessibilityTrusted else {
       logger.error("Cannot start key event monitoring (reason: \(reason)); accessibility permission is not granted.")
@@ -393,20 +410,32 @@ class KeyEventMonitorClientLive {
             return Unmanaged.passUnretained(cgEvent)
           }
 
-          guard hotKeyClientLive.hasRequiredPermissions else {
+          // One lock acquisition per event covers the permission check and both handler lists.
+          let tapState = hotKeyClientLive.tapState.withLock { $0 }
+          guard tapState.hasRequiredPermissions else {
             return Unmanaged.passUnretained(cgEvent)
           }
 
           if type == .leftMouseDown || type == .rightMouseDown || type == .otherMouseDown {
-            _ = hotKeyClientLive.processInputEvent(.mouseClick)
+            if hotKeyClientLive.shouldDeliverMouseClick() {
+              _ = hotKeyClientLive.processEvent(InputEvent.mouseClick, handlers: tapState.inputHandlers)
+            }
             return Unmanaged.passUnretained(cgEvent)
           }
 
           hotKeyClientLive.updateFnStateIfNeeded(type: type, cgEvent: cgEvent)
 
-          let keyEvent = KeyEvent(cgEvent: cgEvent, type: type, isFnPressed: hotKeyClientLive.isFnPressed)
-          let handledByKeyHandler = hotKeyClientLive.processKeyEvent(keyEvent)
-          let handledByInputHandler = hotKeyClientLive.processInputEvent(.keyboard(keyEvent))
+          // Skip building events nobody will receive.
+          let keyHandlers = tapState.keyHandlers
+          let inputHandlers = tapState.inputHandlers
+          guard !(keyHandlers.isEmpty && inputHandlers.isEmpty) else {
+            return Unmanaged.passUnretained(cgEvent)
+          }
+
+          let keyEvent = KeyEvent(cgEvent: cgEvent, type: type, modifiers: hotKeyClientLive.modifiers(for: cgEvent))
+          let handledByKeyHandler = hotKeyClientLive.processEvent(keyEvent, handlers: keyHandlers)
+          let handledByInputHandler = !inputHandlers.isEmpty
+            && hotKeyClientLive.processEvent(InputEvent.keyboard(keyEvent), handlers: inputHandlers)
 
           return (handledByKeyHandler || handledByInputHandler) ? nil : Unmanaged.passUnretained(cgEvent)
         },
@@ -457,21 +486,12 @@ class KeyEventMonitorClientLive {
 
   private func processEvent<T>(
     _ event: T,
-    handlers: [UUID: @Sendable (T) -> Bool]
+    handlers: [@Sendable (T) -> Bool]
   ) -> Bool {
-    let handlerList = queue.sync { Array(handlers.values) }
-    return handlerList.reduce(false) { handled, handler in
+    handlers.reduce(false) { handled, handler in
       handler(event) || handled
     }
   }
-
-  private func processKeyEvent(_ keyEvent: KeyEvent) -> Bool {
-    processEvent(keyEvent, handlers: continuations)
-  }
-
-  private func processInputEvent(_ inputEvent: InputEvent) -> Bool {
-    processEvent(inputEvent, handlers: inputContinuations)
-  }
 }
 
 extension KeyEventMonitorClientLive {
@@ -482,6 +502,30 @@ extension KeyEventMonitorClientLive {
     isFnPressed = cgEvent.flags.contains(.maskSecondaryFn)
   }
 
+  /// Holding a modifier-only hotkey delivers the same flags over and over, so reuse the
+  /// previous conversion when nothing changed. Only called from the tap on the main run loop.
+  private func modifiers(for cgEvent: CGEvent) -> Modifiers {
+    // Drop the fn bit before converting rather than filtering the resulting set afterwards.
+    var flags = cgEvent.flags
+    if !isFnPressed {
+      flags.remove(.maskSecondaryFn)
+    }
+    if flags != lastModifierFlags {
+      lastModifierFlags = flags
+      lastModifiers = Modifiers.from(carbonFlags: flags)
+    }
+    return lastModifiers
+  }
+
+  /// Handlers only care that a click happened, so bursts from multi-button or
+  /// high-polling mice are collapsed into one delivery per coalescing window.
+  private func shouldDeliverMouseClick() -> Bool {
+    let now = DispatchTime.now().uptimeNanoseconds
+    guard now &- lastMouseClickUptime >= mouseClickCoalesceNanoseconds else { return false }
+    lastMouseClickUptime = now
+    return true
+  }
+
   private func refreshTrustedFlag(promptIfUntrusted: Bool) {
     var accessibilityTrusted = currentAccessibilityTrust()
     if !accessibilityTrusted && promptIfUntrusted && !hasPromptedForAccessibilityTrust {
@@ -494,14 +538,20 @@ extension KeyEventMonitorClientLive {
     setPermissionFlags(accessibility: accessibilityTrusted, input: inputMonitoringTrusted)
   }
 
+  private static let accessibilityCheckOptions = [
+    kAXTrustedCheckOptionPrompt.takeUnretainedValue() as String: false,
+  ] as CFDictionary
+
+  private static let accessibilityPromptOptions = [
+    kAXTrustedCheckOptionPrompt.takeUnretainedValue() as String: true,
+  ] as CFDictionary
+
   private func currentAccessibilityTrust() -> Bool {
-    let promptKey = kAXTrustedCheckOptionPrompt.takeUnretainedValue() as String
-    return AXIsProcessTrustedWithOptions([promptKey: false] as CFDictionary)
+    AXIsProcessTrustedWithOptions(Self.accessibilityCheckOptions)
   }
 
   private func requestAccessibilityTrustPrompt() -> Bool {
-    let promptKey = kAXTrustedCheckOptionPrompt.takeUnretainedValue() as String
-    return AXIsProcessTrustedWithOptions([promptKey: true] as CFDictionary)
+    AXIsProcessTrustedWithOptions(Self.accessibilityPromptOptions)
   }
 
   private func currentInputMonitoringTrust() -> Bool {
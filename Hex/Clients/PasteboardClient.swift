@@ -48,35 +48,39 @@ extension DependencyValues {
 
 struct PasteboardClientLive {
     @Shared(.hexSettings) var hexSettings: HexSettings
+
+    /// How long slower apps get to read the transcript before the previous clipboard is restored.
+    /// The restore runs in a detached task, so this never delays the paste itself.
+    private static let clipboardRestoreDelay: Duration = .milliseconds(500)
     
     private struct PasteboardSnapshot {
-        let items: [[String: Any]]
+        let items: [[NSPasteboard.PasteboardType: Data]]
         
         init(pasteboard: NSPasteboard) {
-            var saved: [[String: Any]] = []
-            for item in pasteboard.pasteboardItems ?? [] {
-                var itemDict: [String: Any] = [:]
+            self.items = (pasteboard.pasteboardItems ?? []).map { item in
+                var itemDict: [NSPasteboard.PasteboardType: Data] = [:]
                 for type in item.types {
                     if let data = item.data(forType: type) {
-                        itemDict[type.rawValue] = data
+                        itemDict[type] = data
                     }
                 }
-                saved.append(itemDict)
+                return itemDict
             }
-            self.items = saved
         }
         
         func restore(to pasteboard: NSPasteboard) {
             pasteboard.clearContents()
-            for itemDict in items {
+            // An empty snapshot means the clipboard started empty; clearing is the whole restore.
+            guard !items.isEmpty else { return }
+            let restoredItems = items.map { itemDict in
                 let item = NSPasteboardItem()
                 for (type, data) in itemDict {
-                    if let data = data as? Data {
-                        item.setData(data, forType: NSPasteboard.PasteboardType(rawValue: type))
-                    }
+                    item.setData(data, forType: type)
                 }
-                pasteboard.writeObjects([item])
+                return item
             }
+            // Write every item in one call so the pasteboard server only commits once.
+            pasteboard.writeObjects(restoredItems)
         }
     }
 
@@ -85,7 +89,7 @@ struct PasteboardClientLive {
         if hexSettings.useClipboardPaste {
             await pasteWithClipboard(text)
         } else {
-            simulateTypingWithAppleScript(text)
+            await simulateTyping(text)
         }
     }
     
@@ -152,9 +156,11 @@ struct PasteboardClientLive {
         pasteboardLogger.debug("Sent keyboard command: \(command.displayName)")
     }
 
-    /// Pastes current clipboard content to the frontmost application
-    static func pasteToFrontmostApp() -> Bool {
-        let script = """
+    /// The Edit ▸ Paste walker, compiled once on first use instead of on every fallback paste.
+    /// NSAppleScript is not thread-safe, so it is only ever touched from the main actor.
+    @MainActor
+    private static let menuPasteScript: NSAppleScript? = {
+        let source = """
         if application "System Events" is not running then
             tell application "System Events" to launch
             delay 0.1
@@ -187,25 +193,36 @@ struct PasteboardClientLive {
             end tell
         end tell
         """
-        
+        guard let script = NSAppleScript(source: source) else { return nil }
         var error: NSDictionary?
-        if let scriptObject = NSAppleScript(source: script) {
-            let result = scriptObject.executeAndReturnError(&error)
-            if let error = error {
-                pasteboardLogger.error("AppleScript paste failed: \(error)")
-                return false
-            }
-            return result.booleanValue
+        guard script.compileAndReturnError(&error) else {
+            pasteboardLogger.error("Failed to compile AppleScript paste fallback: \(String(describing: error))")
+            return nil
         }
-        return false
+        return script
+    }()
+
+    /// Pastes current clipboard content to the frontmost application
+    @MainActor
+    static func pasteToFrontmostApp() -> Bool {
+        guard let script = menuPasteScript else { return false }
+        var error: NSDictionary?
+        let result = script.executeAndReturnError(&error)
+        if let error = error {
+            pasteboardLogger.error("AppleScript paste failed: \(error)")
+            return false
+        }
+        return result.booleanValue
     }
 
     @MainActor
     func pasteWithClipboard(_ text: String) async {
         let pasteboard = NSPasteboard.general
         let snapshot = PasteboardSnapshot(pasteboard: pasteboard)
-        let targetChangeCount = writeAndTrackChangeCount(pasteboard: pasteboard, text: text)
-        _ = await waitForPasteboardCommit(targetChangeCount: targetChangeCount)
+        // setString bumps changeCount synchronously, so only poll when the write was coalesced.
+        if let pendingChangeCount = writeAndTrackChangeCount(pasteboard: pasteboard, text: text) {
+            _ = await waitForPasteboardCommit(targetChangeCount: pendingChangeCount)
+        }
         let pasteSucceeded = await performPaste(text)
         
         // Only restore original pasteboard contents if:
@@ -216,8 +233,7 @@ struct PasteboardClientLive {
             Task { @MainActor in
                 // Give slower apps a short window to read the plain-text entry
                 // before we repopulate the clipboard with the user's previous rich data.
-                try? await Task.sleep(for: .milliseconds(500))
-                pasteboard.clearContents()
+                try? await Task.sleep(for: Self.clipboardRestoreDelay)
                 savedSnapshot.restore(to: pasteboard)
             }
         }
@@ -233,8 +249,10 @@ struct PasteboardClientLive {
         }
     }
 
+    /// Writes `text` and returns the change count to wait for, or `nil` if the write has
+    /// already landed.
     @MainActor
-    private func writeAndTrackChangeCount(pasteboard: NSPasteboard, text: String) -> Int {
+    private func writeAndTrackChangeCount(pasteboard: NSPasteboard, text: String) -> Int? {
         let before = pasteboard.changeCount
         pasteboard.clearContents()
         pasteboard.setString(text, forType: .string)
@@ -244,14 +262,14 @@ struct PasteboardClientLive {
             // coalesces writes (seen on Sonoma betas with zero-length strings).
             return after + 1
         }
-        return after
+        return nil
     }
 
     @MainActor
     private func waitForPasteboardCommit(
         targetChangeCount: Int,
         timeout: Duration = .milliseconds(150),
-        pollInterval: Duration = .milliseconds(5)
+        pollInterval: Duration = .milliseconds(1)
     ) async -> Bool {
         guard targetChangeCount > NSPasteboard.general.changeCount else { return true }
 
@@ -267,6 +285,7 @@ struct PasteboardClientLive {
 
     // MARK: - Paste Orchestration
 
+    /// Paste strategies in the order they are tried; the first one that succeeds wins.
     @MainActor
     private enum PasteStrategy: CaseIterable {
         case cmdV
@@ -280,6 +299,7 @@ struct PasteboardClientLive {
             if await attemptPaste(text, using: strategy) {
                 return true
             }
+            pasteboardLogger.debug("Paste strategy \(String(describing: strategy)) failed")
         }
         return false
     }
@@ -305,16 +325,22 @@ struct PasteboardClientLive {
         let source = CGEventSource(stateID: .combinedSessionState)
         let vKey = vKeyCode()
         let cmdKey: CGKeyCode = 55
-        let cmdDown = CGEvent(keyboardEventSource: source, virtualKey: cmdKey, keyDown: true)
-        let vDown = CGEvent(keyboardEventSource: source, virtualKey: vKey, keyDown: true)
-        vDown?.flags = .maskCommand
-        let vUp = CGEvent(keyboardEventSource: source, virtualKey: vKey, keyDown: false)
-        vUp?.flags = .maskCommand
-        let cmdUp = CGEvent(keyboardEventSource: source, virtualKey: cmdKey, keyDown: false)
-        cmdDown?.post(tap: .cghidEventTap)
-        vDown?.post(tap: .cghidEventTap)
-        vUp?.post(tap: .cghidEventTap)
-        cmdUp?.post(tap: .cghidEventTap)
+        // Posting can't report delivery, but failing to build the events is a real failure
+        // that should let the menu-item fallback run.
+        guard let cmdDown = CGEvent(keyboardEventSource: source, virtualKey: cmdKey, keyDown: true),
+              let vDown = CGEvent(keyboardEventSource: source, virtualKey: vKey, keyDown: true),
+              let vUp = CGEvent(keyboardEventSource: source, virtualKey: vKey, keyDown: false),
+              let cmdUp = CGEvent(keyboardEventSource: source, virtualKey: cmdKey, keyDown: false)
+        else {
+            pasteboardLogger.error("Failed to create ⌘V key events")
+            return false
+        }
+        vDown.flags = .maskCommand
+        vUp.flags = .maskCommand
+        cmdDown.post(tap: .cghidEventTap)
+        vDown.post(tap: .cghidEventTap)
+        vUp.post(tap: .cghidEventTap)
+        cmdUp.post(tap: .cghidEventTap)
         return true
     }
 
@@ -330,16 +356,43 @@ struct PasteboardClientLive {
         try await Task.sleep(nanoseconds: UInt64(milliseconds) * 1_000_000)
     }
     
-    func simulateTypingWithAppleScript(_ text: String) {
-        let escapedText = text.replacingOccurrences(of: "\"", with: "\\\"")
-        let script = NSAppleScript(source: "tell application \"System Events\" to keystroke \"\(escapedText)\"")
-        var error: NSDictionary?
-        script?.executeAndReturnError(&error)
-        if let error = error {
-            pasteboardLogger.error("Error executing AppleScript typing fallback: \(error)")
+    /// Types `text` into the focused app by posting key events that carry the characters
+    /// themselves, so there is no AppleScript to compile and no quoting to escape.
+    @MainActor
+    func simulateTyping(_ text: String) async {
+        let source = CGEventSource(stateID: .combinedSessionState)
+        let utf16 = Array(text.utf16)
+        var start = 0
+        while start < utf16.count {
+            if start > 0 {
+                // Give the receiving app time to consume the previous chunk so slow
+                // text views don't drop or reorder characters.
+                try? await Task.sleep(for: Self.typingChunkDelay)
+            }
+            var end = min(start + Self.maxUnicodeCharactersPerEvent, utf16.count)
+            // Never split a surrogate pair across two events.
+            if end < utf16.count, UTF16.isLeadSurrogate(utf16[end - 1]) {
+                end -= 1
+            }
+            let chunk = Array(utf16[start..<end])
+            for keyDown in [true, false] {
+                let event = CGEvent(keyboardEventSource: source, virtualKey: 0, keyDown: keyDown)
+                // Ignore any hotkey modifiers the user is still holding.
+                event?.flags = []
+                event?.keyboardSetUnicodeString(stringLength: chunk.count, unicodeString: chunk)
+                event?.post(tap: .cghidEventTap)
+            }
+            start = end
         }
+        pasteboardLogger.debug("Typed \(text.count) characters via synthesized key events")
     }
 
+    /// CGEvents only deliver the first 20 UTF-16 units of an attached unicode string.
+    private static let maxUnicodeCharactersPerEvent = 20
+
+    /// Pause between posted chunks when typing.
+    private static let typingChunkDelay: Duration = .milliseconds(5)
+
     enum PasteError: Error {
         case systemWideElementCreationFailed
         case focusedElementNotFound
@@ -40,8 +40,11 @@ public struct SoundEffectsClient {
 extension SoundEffectsClient: DependencyKey {
   public static var liveValue: SoundEffectsClient {
     let live = SoundEffectsClientLive()
+    @Shared(.hexSettings) var hexSettings: HexSettings
     return SoundEffectsClient(
       play: { soundEffect in
+        // Don't spawn a task and hop onto the actor just to find out sounds are off.
+        guard hexSettings.soundEffectsEnabled else { return }
         Task { await live.play(soundEffect) }
       },
       stop: { soundEffect in
@@ -75,13 +78,18 @@ actor SoundEffectsClientLive {
   private var isEngineRunning = false
 
   func play(_ soundEffect: SoundEffect) {
-	guard hexSettings.soundEffectsEnabled else { return }
+	let settings = hexSettings
+	guard settings.soundEffectsEnabled else { return }
+	if audioBuffers[soundEffect] == nil {
+		// A sound requested before preloadSounds finished is decoded once here and kept.
+		loadSound(soundEffect)
+	}
 	guard let player = playerNodes[soundEffect], let buffer = audioBuffers[soundEffect] else {
-		logger.error("Requested sound \(soundEffect.rawValue) not preloaded")
+		logger.error("Requested sound \(soundEffect.rawValue) could not be loaded")
 		return
 	}
 	prepareEngineIfNeeded()
-	let clampedVolume = min(max(hexSettings.soundEffectsVolume, 0), baselineVolume)
+	let clampedVolume = min(max(settings.soundEffectsVolume, 0), baselineVolume)
 	player.volume = Float(clampedVolume)
 	player.stop()
 	player.scheduleBuffer(buffer, at: nil, options: [], completionHandler: nil)
@@ -99,7 +107,7 @@ actor SoundEffectsClientLive {
   func preloadSounds() async {
     guard !isSetup else { return }
 
-    for soundEffect in SoundEffect.allCases {
+    for soundEffect in SoundEffect.allCases where audioBuffers[soundEffect] == nil {
       loadSound(soundEffect)
     }
     prepareEngineIfNeeded()
@@ -11,6 +11,19 @@ private let historyLogger = HexLog.history
 // MARK: - Date Extensions
 
 extension Date {
+	private static let weekdayFormatter: DateFormatter = {
+		let formatter = DateFormatter()
+		formatter.dateFormat = "EEEE" // Day of week
+		return formatter
+	}()
+
+	private static let mediumDateFormatter: DateFormatter = {
+		let formatter = DateFormatter()
+		formatter.dateStyle = .medium
+		formatter.timeStyle = .none
+		return formatter
+	}()
+
 	func relativeFormatted() -> String {
 		let calendar = Calendar.current
 		let now = Date()
@@ -20,14 +33,9 @@ extension Date {
 		} else if calendar.isDateInYesterday(self) {
 			return "Yesterday"
 		} else if let daysAgo = calendar.dateComponents([.day], from: self, to: now).day, daysAgo < 7 {
-			let formatter = DateFormatter()
-			formatter.dateFormat = "EEEE" // Day of week
-			return formatter.string(from: self)
+			return Date.weekdayFormatter.string(from: self)
 		} else {
-			let formatter = DateFormatter()
-			formatter.dateStyle = .medium
-			formatter.timeStyle = .none
-			return formatter.string(from: self)
+			return Date.mediumDateFormatter.string(from: self)
 		}
 	}
 }
@@ -48,15 +56,14 @@ extension SharedReaderKey
 // MARK: - Storage Migration
 
 extension URL {
-	static var transcriptionHistoryURL: URL {
-		get {
-			let newURL = (try? URL.hexApplicationSupport.appending(component: "transcription_history.json"))
-				?? URL.documentsDirectory.appending(component: "transcription_history.json")
-			let legacyURL = URL.legacyDocumentsDirectory.appending(component: "transcription_history.json")
-			FileManager.default.migrateIfNeeded(from: legacyURL, to: newURL)
-			return newURL
-		}
-	}
+	/// Resolved (and migrated) once per launch; every `@Shared(.transcriptionHistory)` reads it.
+	static let transcriptionHistoryURL: URL = {
+		let newURL = (try? URL.hexApplicationSupport.appending(component: "transcription_history.json"))
+			?? URL.documentsDirectory.appending(component: "transcription_history.json")
+		let legacyURL = URL.legacyDocumentsDirectory.appending(component: "transcription_history.json")
+		FileManager.default.migrateIfNeeded(from: legacyURL, to: newURL)
+		return newURL
+	}()
 }
 
 class AudioPlayerController: NSObject, AVAudioPlayerDelegate {
@@ -116,6 +123,7 @@ struct HistoryFeature {
 	}
 
 	@Dependency(\.pasteboard) var pasteboard
+	@Dependency(\.transcriptPersistence) var transcriptPersistence
 
 	var body: some ReducerOf<Self> {
 		Reduce { state, action in
@@ -200,10 +208,8 @@ struct HistoryFeature {
 					history.history.removeAll()
 				}
 
-				return .run { _ in
-					for transcript in transcripts {
-						try? FileManager.default.removeItem(at: transcript.audioPath)
-					}
+				return .run { [transcriptPersistence] _ in
+					await transcriptPersistence.deleteAudio(of: transcripts)
 				}
 				
 			case .navigateToSettings:
@@ -236,8 +242,8 @@ struct TranscriptView: View {
 				HStack(spacing: 6) {
 					// App icon and name
 					if let bundleID = transcript.sourceAppBundleID,
-					   let appURL = NSWorkspace.shared.urlForApplication(withBundleIdentifier: bundleID) {
-						Image(nsImage: NSWorkspace.shared.icon(forFile: appURL.path))
+					   let appIcon = Self.appIcon(forBundleID: bundleID) {
+						Image(nsImage: appIcon)
 							.resizable()
 							.frame(width: 14, height: 14)
 						if let appName = transcript.sourceAppName {
@@ -311,6 +317,21 @@ struct TranscriptView: View {
 	@State private var showCopied = false
 	@State private var copyTask: Task<Void, Error>?
 
+	/// Source-app icons keyed by bundle ID. Misses aren't cached, so an app installed later still gets its icon.
+	private static var appIconCache: [String: NSImage] = [:]
+
+	private static func appIcon(forBundleID bundleID: String) -> NSImage? {
+		if let cached = appIconCache[bundleID] {
+			return cached
+		}
+		guard let appURL = NSWorkspace.shared.urlForApplication(withBundleIdentifier: bundleID) else {
+			return nil
+		}
+		let icon = NSWorkspace.shared.icon(forFile: appURL.path)
+		appIconCache[bundleID] = icon
+		return icon
+	}
+
 	private func showCopyAnimation() {
 		copyTask?.cancel()
 
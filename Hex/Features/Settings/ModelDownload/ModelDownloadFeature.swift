@@ -79,7 +79,14 @@ public struct CuratedModelInfo: Equatable, Identifiable, Codable {
 
 // Convenience helper for loading the bundled models.json once.
 private enum CuratedModelLoader {
+	/// The bundle never changes at runtime, so decode `models.json` once and hand out copies.
+	private static let cached: [CuratedModelInfo] = decode()
+
 	static func load() -> [CuratedModelInfo] {
+		cached
+	}
+
+	private static func decode() -> [CuratedModelInfo] {
 		guard let url = Bundle.main.url(forResource: "models", withExtension: "json") ??
 			Bundle.main.url(forResource: "models", withExtension: "json", subdirectory: "Data")
 		else {
@@ -328,9 +335,7 @@ public struct ModelDownloadFeature {
 			switch result {
 			case let .success(name):
 				state.availableModels[id: name]?.isDownloaded = true
-				if let idx = state.curatedModels.firstIndex(where: { $0.internalName == name }) {
-					state.curatedModels[idx].isDownloaded = true
-				}
+				state.curatedModels[id: name]?.isDownloaded = true
 				state.$hexSettings.withLock { settings in
 					settings.hasCompletedModelBootstrap = true
 				}
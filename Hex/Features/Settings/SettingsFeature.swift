@@ -98,6 +98,7 @@ struct SettingsFeature {
   @Dependency(\.transcription) var transcription
   @Dependency(\.recording) var recording
   @Dependency(\.permissions) var permissions
+  @Dependency(\.transcriptPersistence) var transcriptPersistence
 
   var body: some ReducerOf<Self> {
     BindingReducer()
@@ -116,10 +117,7 @@ struct SettingsFeature {
         }
 
       case .task:
-        if let url = Bundle.main.url(forResource: "languages", withExtension: "json"),
-          let data = try? Data(contentsOf: url),
-          let languages = try? JSONDecoder().decode([Language].self, from: data)
-        {
+        if let languages = Language.bundled {
           state.languages = IdentifiedArray(uniqueElements: languages)
         } else {
           settingsLogger.error("Failed to load languages JSON from bundle")
@@ -354,10 +352,8 @@ struct SettingsFeature {
           }
           
           // Delete all audio files
-          return .run { _ in
-            for transcript in transcripts {
-              try? FileManager.default.removeItem(at: transcript.audioPath)
-            }
+          return .run { [transcriptPersistence] _ in
+            await transcriptPersistence.deleteAudio(of: transcripts)
           }
         }
         
@@ -164,6 +164,10 @@ private extension TranscriptionFeature {
       @Shared(.isSettingHotKey) var isSettingHotKey: Bool
       @Shared(.hexSettings) var hexSettings: HexSettings
 
+      // Queue hotkey decisions and send them from a single consumer loop, so the tap callback
+      // returns right away and actions arrive in the order the key events happened.
+      let hotKeyActions = AsyncStream.makeStream(of: Action.self)
+
       // Handle incoming input events (keyboard and mouse)
       let token = keyEventMonitor.handleInputEvent { inputEvent in
         // Skip if the user is currently setting a hotkey
@@ -182,7 +186,7 @@ private extension TranscriptionFeature {
           if keyEvent.key == .escape, keyEvent.modifiers.isEmpty,
              hotKeyProcessor.state == .idle
           {
-            Task { await send(.cancel) }
+            hotKeyActions.continuation.yield(.cancel)
             return false
           }
 
@@ -191,24 +195,24 @@ private extension TranscriptionFeature {
           case .startRecording:
             // If double-tap lock is triggered, we start recording immediately
             if hotKeyProcessor.state == .doubleTapLock {
-              Task { await send(.startRecording) }
+              hotKeyActions.continuation.yield(.startRecording)
             } else {
-              Task { await send(.hotKeyPressed) }
+              hotKeyActions.continuation.yield(.hotKeyPressed)
             }
             // If the hotkey is purely modifiers, return false to keep it from interfering with normal usage
             // But if useDoubleTapOnly is true, always intercept the key
             return hexSettings.useDoubleTapOnly || keyEvent.key != nil
 
           case .stopRecording:
-            Task { await send(.hotKeyReleased) }
+            hotKeyActions.continuation.yield(.hotKeyReleased)
             return false // or `true` if you want to intercept
 
           case .cancel:
-            Task { await send(.cancel) }
+            hotKeyActions.continuation.yield(.cancel)
             return true
 
           case .discard:
-            Task { await send(.discard) }
+            hotKeyActions.continuation.yield(.discard)
             return false // Don't intercept - let the key chord reach other apps
 
           case .none:
@@ -226,10 +230,10 @@ private extension TranscriptionFeature {
           // Process mouse click - for modifier-only hotkeys, this may cancel/discard
           switch hotKeyProcessor.processMouseClick() {
           case .cancel:
-            Task { await send(.cancel) }
+            hotKeyActions.continuation.yield(.cancel)
             return false // Don't intercept the click itself
           case .discard:
-            Task { await send(.discard) }
+            hotKeyActions.continuation.yield(.discard)
             return false // Don't intercept the click itself
           case .startRecording, .stopRecording, .none:
             return false
@@ -240,11 +244,12 @@ private extension TranscriptionFeature {
       defer { token.cancel() }
 
       await withTaskCancellationHandler {
-        while !Task.isCancelled {
-          try? await Task.sleep(for: .seconds(60))
+        for await action in hotKeyActions.stream {
+          await send(action)
         }
       } onCancel: {
         token.cancel()
+        hotKeyActions.continuation.finish()
       }
     }
   }
@@ -440,19 +445,15 @@ private extension TranscriptionFeature {
     let sourceAppName = state.sourceAppName
     let transcriptionHistory = state.$transcriptionHistory
 
-    return .run { send in
-      do {
-        try await finalizeRecordingAndStoreTranscript(
-          result: modifiedResult,
-          duration: duration,
-          sourceAppBundleID: sourceAppBundleID,
-          sourceAppName: sourceAppName,
-          audioURL: audioURL,
-          transcriptionHistory: transcriptionHistory
-        )
-      } catch {
-        await send(.transcriptionError(error, audioURL))
-      }
+    return .run { _ in
+      await finalizeRecordingAndStoreTranscript(
+        result: modifiedResult,
+        duration: duration,
+        sourceAppBundleID: sourceAppBundleID,
+        sourceAppName: sourceAppName,
+        audioURL: audioURL,
+        transcriptionHistory: transcriptionHistory
+      )
     }
     .cancellable(id: CancelID.transcription)
   }
@@ -481,37 +482,73 @@ private extension TranscriptionFeature {
     sourceAppName: String?,
     audioURL: URL,
     transcriptionHistory: Shared<TranscriptionHistory>
-  ) async throws {
+  ) async {
+    // Store the recording while the paste is in flight, so the user only
+    // waits on the paste and not on file I/O.
+    async let stored: Void = storeTranscript(
+      result: result,
+      duration: duration,
+      sourceAppBundleID: sourceAppBundleID,
+      sourceAppName: sourceAppName,
+      audioURL: audioURL,
+      transcriptionHistory: transcriptionHistory
+    )
+
+    await pasteboard.paste(result)
+    soundEffect.play(.pasteTranscript)
+
+    await stored
+  }
+
+  /// Moves the recording into history, or deletes it when history is disabled.
+  ///
+  /// The text is pasted concurrently, so a failed save must not surface as a
+  /// transcription error; it is logged and the recording dropped instead.
+  func storeTranscript(
+    result: String,
+    duration: TimeInterval,
+    sourceAppBundleID: String?,
+    sourceAppName: String?,
+    audioURL: URL,
+    transcriptionHistory: Shared<TranscriptionHistory>
+  ) async {
     @Shared(.hexSettings) var hexSettings: HexSettings
 
-    if hexSettings.saveTranscriptionHistory {
-      let transcript = try await transcriptPersistence.save(
+    guard hexSettings.saveTranscriptionHistory else {
+      try? FileManager.default.removeItem(at: audioURL)
+      return
+    }
+
+    let transcript: Transcript
+    do {
+      transcript = try await transcriptPersistence.save(
         result,
         audioURL,
         duration,
         sourceAppBundleID,
         sourceAppName
       )
+    } catch {
+      transcriptionFeatureLogger.error("Failed to save transcript to history: \(error.localizedDescription)")
+      try? FileManager.default.removeItem(at: audioURL)
+      return
+    }
 
-      transcriptionHistory.withLock { history in
-        history.history.insert(transcript, at: 0)
-
-        if let maxEntries = hexSettings.maxHistoryEntries, maxEntries > 0 {
-          while history.history.count > maxEntries {
-            if let removedTranscript = history.history.popLast() {
-              Task {
-                 try? await transcriptPersistence.deleteAudio(removedTranscript)
-              }
-            }
-          }
+    let transcriptPersistence = self.transcriptPersistence
+    transcriptionHistory.withLock { history in
+      history.history.insert(transcript, at: 0)
+
+      // History is kept newest-first, so trimming is a single suffix removal.
+      if let maxEntries = hexSettings.maxHistoryEntries, maxEntries > 0,
+         history.history.count > maxEntries
+      {
+        let removedTranscripts = Array(history.history[maxEntries...])
+        history.history.removeLast(removedTranscripts.count)
+        Task {
+          await transcriptPersistence.deleteAudio(of: removedTranscripts)
         }
       }
-    } else {
-      try? FileManager.default.removeItem(at: audioURL)
     }
-
-    await pasteboard.paste(result)
-    soundEffect.play(.pasteTranscript)
   }
 }
 
@@ -12,18 +12,21 @@ typealias HexSettings = HexCore.HexSettings
 extension URL {
 	/// Returns the Application Support directory for Hex
 	static var hexApplicationSupport: URL {
-		get throws {
-			let fm = FileManager.default
-			let appSupport = try fm.url(
-				for: .applicationSupportDirectory,
-				in: .userDomainMask,
-				appropriateFor: nil,
-				create: true
-			)
-			let hexDir = appSupport.appending(component: "com.kitlangton.Hex")
-			try fm.createDirectory(at: hexDir, withIntermediateDirectories: true)
-			return hexDir
-		}
+		get throws { try hexApplicationSupportResult.get() }
+	}
+
+	/// Looked up and created once; settings, history and caches all hang off this directory.
+	private static let hexApplicationSupportResult = Result<URL, Error> {
+		let fm = FileManager.default
+		let appSupport = try fm.url(
+			for: .applicationSupportDirectory,
+			in: .userDomainMask,
+			appropriateFor: nil,
+			create: true
+		)
+		let hexDir = appSupport.appending(component: "com.kitlangton.Hex")
+		try fm.createDirectory(at: hexDir, withIntermediateDirectories: true)
+		return hexDir
 	}
 
 	/// Legacy location in Documents (for migration)
@@ -60,13 +63,13 @@ extension SharedReaderKey
 // MARK: - Storage Migration
 
 extension URL {
-	static var hexSettingsURL: URL {
-		get {
-			let newURL = (try? URL.hexApplicationSupport.appending(component: "hex_settings.json"))
-				?? URL.documentsDirectory.appending(component: "hex_settings.json")
-			let legacyURL = URL.legacyDocumentsDirectory.appending(component: "hex_settings.json")
-			FileManager.default.migrateIfNeeded(from: legacyURL, to: newURL)
-			return newURL
-		}
-	}
+	/// Resolved once per launch. Every `@Shared(.hexSettings)` declaration builds its key from
+	/// this URL, so recomputing it repeated the directory creation and migration checks each time.
+	static let hexSettingsURL: URL = {
+		let newURL = (try? URL.hexApplicationSupport.appending(component: "hex_settings.json"))
+			?? URL.documentsDirectory.appending(component: "hex_settings.json")
+		let legacyURL = URL.legacyDocumentsDirectory.appending(component: "hex_settings.json")
+		FileManager.default.migrateIfNeeded(from: legacyURL, to: newURL)
+		return newURL
+	}()
 }
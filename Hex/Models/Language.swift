@@ -13,3 +13,13 @@ struct Language: Codable, Identifiable, Hashable, Equatable {
 struct LanguageList: Codable {
     let languages: [Language]
 }
+
+extension Language {
+    /// Languages bundled in `languages.json`, decoded once per launch; `nil` if the resource is missing or malformed.
+    static let bundled: [Language]? = {
+        guard let url = Bundle.main.url(forResource: "languages", withExtension: "json"),
+              let data = try? Data(contentsOf: url)
+        else { return nil }
+        return try? JSONDecoder().decode([Language].self, from: data)
+    }()
+}
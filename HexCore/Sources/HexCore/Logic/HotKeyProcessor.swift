@@ -163,12 +163,15 @@ public struct HotKeyProcessor {
         // 1) ESC => immediate cancel
         if keyEvent.key == .escape {
             let currentState = state
-            hotKeyLogger.notice("ESC pressed while state=\(String(describing: currentState))")
-        }
-        if keyEvent.key == .escape, state != .idle {
-            isDirty = true
-            resetToIdle()
-            return .cancel
+            if currentState == .idle {
+                // ESC while idle is ordinary typing; keep it out of the persisted log.
+                hotKeyLogger.debug("ESC pressed while idle")
+            } else {
+                hotKeyLogger.notice("ESC pressed while state=\(String(describing: currentState))")
+                isDirty = true
+                resetToIdle()
+                return .cancel
+            }
         }
 
         // 2) If dirty, ignore until full release (nil, [])
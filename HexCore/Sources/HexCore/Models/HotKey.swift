@@ -25,6 +25,11 @@ public struct Modifier: Identifiable, Codable, Equatable, Hashable, Comparable,
       }
     }
 
+    /// Single-bit flag for this kind, used to compare modifier kinds without allocating sets.
+    var bit: UInt8 {
+      1 << UInt8(order)
+    }
+
     public var displayName: String {
       switch self {
       case .command: return "Command"
@@ -171,6 +176,11 @@ public struct Modifiers: Codable, Equatable, ExpressibleByArrayLiteral, Sendable
     modifiers.isEmpty
   }
 
+  /// Bitmask of the modifier kinds present, ignoring sides.
+  var kindMask: UInt8 {
+    modifiers.reduce(0) { $0 | $1.kind.bit }
+  }
+
   public init(modifiers: Set<Modifier>) {
     self.modifiers = modifiers
   }
@@ -192,7 +202,8 @@ public struct Modifiers: Codable, Equatable, ExpressibleByArrayLiteral, Sendable
   }
 
   public func isSubset(of other: Modifiers) -> Bool {
-    modifiers.allSatisfy { element in
+    guard kindMask & ~other.kindMask == 0 else { return false }
+    return modifiers.allSatisfy { element in
       other.contains(element)
     }
   }
@@ -212,14 +223,15 @@ public struct Modifiers: Codable, Equatable, ExpressibleByArrayLiteral, Sendable
   }
 
   public func matchesExactly(_ expected: Modifiers) -> Bool {
+    // An exact match needs exactly the same kinds, so compare the bitmasks
+    // before looking at sides. This rejects most key events without a set lookup.
+    guard kindMask == expected.kindMask else { return false }
+
     guard expected.modifiers.allSatisfy({ requirement in self.contains(requirement) }) else {
       return false
     }
 
-    let allowedKinds = Set(expected.modifiers.map { $0.kind })
-
     return modifiers.allSatisfy { candidate in
-      guard allowedKinds.contains(candidate.kind) else { return false }
       guard let requirement = expected.modifiers.first(where: { $0.kind == candidate.kind }) else {
         return false
       }
@@ -269,6 +281,8 @@ public struct Modifiers: Codable, Equatable, ExpressibleByArrayLiteral, Sendable
   }
 
   public static func from(carbonFlags: CGEventFlags) -> Modifiers {
+    // Most tap events are plain typing; skip the per-kind checks when no modifier bit is set.
+    guard carbonFlags.rawValue & DeviceModifierMask.anyModifier != 0 else { return [] }
     var modifiers: Set<Modifier> = []
 
     func insert(kind: Modifier.Kind, general: CGEventFlags, leftMask: UInt64?, rightMask: UInt64?) {
@@ -309,6 +323,12 @@ private enum DeviceModifierMask {
   static let leftOption: UInt64 = 0x00000020
   static let rightOption: UInt64 = 0x00000040
   static let rightControl: UInt64 = 0x00002000
+
+  static let anyModifier: UInt64 =
+    leftControl | leftShift | rightShift | leftCommand | rightCommand | leftOption | rightOption | rightControl
+    | CGEventFlags.maskShift.rawValue | CGEventFlags.maskControl.rawValue
+    | CGEventFlags.maskAlternate.rawValue | CGEventFlags.maskCommand.rawValue
+    | CGEventFlags.maskSecondaryFn.rawValue
 }
 
 public struct HotKey: Codable, Equatable, Sendable {
@@ -15,29 +15,41 @@ public struct TranscriptPersistenceClient: Sendable {
 
 extension TranscriptPersistenceClient: DependencyKey {
     public static let liveValue: TranscriptPersistenceClient = {
+        // Application Support/com.kitlangton.Hex/Recordings (HexCore can't see the app's
+        // URL.hexApplicationSupport). Resolved and created once per launch; save only
+        // recreates the folder if it has been removed since.
+        let recordingsFolderResult = Result {
+            try FileManager.default.url(
+                for: .applicationSupportDirectory,
+                in: .userDomainMask,
+                appropriateFor: nil,
+                create: true
+            )
+            .appendingPathComponent("com.kitlangton.Hex", isDirectory: true)
+            .appendingPathComponent("Recordings", isDirectory: true)
+        }
+        if case let .success(folder) = recordingsFolderResult {
+            try? FileManager.default.createDirectory(at: folder, withIntermediateDirectories: true)
+        }
+
         return TranscriptPersistenceClient(
             save: { result, audioURL, duration, sourceAppBundleID, sourceAppName in
                 let fm = FileManager.default
-                // We need the base URL. Since we can't easily access AppHexSettings.hexApplicationSupport from here without circular dependency,
-                // we will replicate the logic or use a standard location.
-                // Ideally, this should be injected or configured.
-                
-                let supportDir = try fm.url(
-                    for: .applicationSupportDirectory,
-                    in: .userDomainMask,
-                    appropriateFor: nil,
-                    create: true
-                )
-                let ourAppFolder = supportDir.appendingPathComponent("com.kitlangton.Hex", isDirectory: true)
-                let recordingsFolder = ourAppFolder.appendingPathComponent("Recordings", isDirectory: true)
-                try fm.createDirectory(at: recordingsFolder, withIntermediateDirectories: true)
+                let recordingsFolder = try recordingsFolderResult.get()
                 
-                let filename = "\(Date().timeIntervalSince1970).wav"
+                // One clock read, so the file name and the transcript agree on when it happened.
+                let now = Date()
+                let filename = "\(now.timeIntervalSince1970).wav"
                 let finalURL = recordingsFolder.appendingPathComponent(filename)
-                try fm.moveItem(at: audioURL, to: finalURL)
+                do {
+                    try fm.renameOrMoveItem(at: audioURL, to: finalURL)
+                } catch where !fm.fileExists(atPath: recordingsFolder.path) {
+                    try fm.createDirectory(at: recordingsFolder, withIntermediateDirectories: true)
+                    try fm.renameOrMoveItem(at: audioURL, to: finalURL)
+                }
                 
                 return Transcript(
-                    timestamp: Date(),
+                    timestamp: now,
                     text: result,
                     audioPath: finalURL,
                     duration: duration,
@@ -59,9 +71,33 @@ extension TranscriptPersistenceClient: DependencyKey {
     )
 }
 
+public extension TranscriptPersistenceClient {
+    /// Deletes the audio of several transcripts concurrently, ignoring files that are already gone.
+    func deleteAudio(of transcripts: [Transcript]) async {
+        await withTaskGroup(of: Void.self) { group in
+            for transcript in transcripts {
+                group.addTask { try? await deleteAudio(transcript) }
+            }
+        }
+    }
+}
+
 public extension DependencyValues {
     var transcriptPersistence: TranscriptPersistenceClient {
         get { self[TranscriptPersistenceClient.self] }
         set { self[TranscriptPersistenceClient.self] = newValue }
     }
 }
+
+extension FileManager {
+    /// Renames in a single syscall when both URLs are on the same volume, which is the normal
+    /// case for recordings, and only falls back to `moveItem` (copy + delete) across volumes.
+    func renameOrMoveItem(at source: URL, to destination: URL) throws {
+        guard rename(source.path, destination.path) != 0 else { return }
+        let code = errno
+        guard code == EXDEV else {
+            throw POSIXError(POSIXErrorCode(rawValue: code) ?? .EIO)
+        }
+        try moveItem(at: source, to: destination)
+    }
+}
@@ -0,0 +1,44 @@
+import CoreGraphics
+import Testing
+@testable import HexCore
+
+struct ModifiersTests {
+	@Test
+	func matchesExactlyRequiresSameKinds() {
+		let expected: Modifiers = [.command, .option]
+		#expect(Modifiers(modifiers: [.option, .command]).matchesExactly(expected))
+		#expect(!Modifiers(modifiers: [.command]).matchesExactly(expected))
+		#expect(!Modifiers(modifiers: [.command, .option, .shift]).matchesExactly(expected))
+	}
+
+	@Test
+	func matchesExactlyRespectsSides() {
+		let expected: Modifiers = [Modifier(kind: .option, side: .left)]
+		#expect(Modifiers(modifiers: [Modifier(kind: .option, side: .left)]).matchesExactly(expected))
+		#expect(!Modifiers(modifiers: [Modifier(kind: .option, side: .right)]).matchesExactly(expected))
+		#expect(Modifiers(modifiers: [Modifier(kind: .option, side: .right)]).matchesExactly([.option]))
+	}
+
+	@Test
+	func isSubsetChecksKindsAndSides() {
+		#expect(Modifiers(modifiers: [.option]).isSubset(of: [.option, .command]))
+		#expect(!Modifiers(modifiers: [.option, .shift]).isSubset(of: [.option, .command]))
+		#expect(!Modifiers(modifiers: [Modifier(kind: .command, side: .right)]).isSubset(of: [Modifier(kind: .command, side: .left)]))
+		#expect(Modifiers(modifiers: []).isSubset(of: []))
+	}
+
+	@Test
+	func kindMaskIgnoresSides() {
+		let sided: Modifiers = [Modifier(kind: .shift, side: .left), Modifier(kind: .shift, side: .right)]
+		#expect(sided.kindMask == Modifiers(modifiers: [.shift]).kindMask)
+		#expect(Modifiers(modifiers: []).kindMask == 0)
+	}
+
+	@Test
+	func fromCarbonFlagsIgnoresNonModifierBits() {
+		#expect(Modifiers.from(carbonFlags: []).isEmpty)
+		#expect(Modifiers.from(carbonFlags: [.maskNonCoalesced, .maskNumericPad]).isEmpty)
+		let leftOption = CGEventFlags(rawValue: CGEventFlags.maskAlternate.rawValue | 0x20)
+		#expect(Modifiers.from(carbonFlags: leftOption) == [Modifier(kind: .option, side: .left)])
+	}
+}
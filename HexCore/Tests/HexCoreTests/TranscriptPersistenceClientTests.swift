@@ -0,0 +1,70 @@
+import Foundation
+import Testing
+@testable import HexCore
+
+struct TranscriptPersistenceClientTests {
+	@Test
+	func deleteAudioOfTranscriptsRemovesEveryFileAndIgnoresMissingOnes() async throws {
+		let directory = try makeTemporaryDirectory()
+		defer { try? FileManager.default.removeItem(at: directory) }
+
+		let existing = (0..<3).map { directory.appendingPathComponent("\($0).wav") }
+		for url in existing {
+			try Data("audio".utf8).write(to: url)
+		}
+		let missing = directory.appendingPathComponent("missing.wav")
+		let transcripts = ([missing] + existing).map {
+			Transcript(timestamp: Date(), text: "", audioPath: $0, duration: 0)
+		}
+
+		// Same per-file delete as the live client, without touching Application Support.
+		let client = TranscriptPersistenceClient(
+			save: TranscriptPersistenceClient.testValue.save,
+			deleteAudio: { try FileManager.default.removeItem(at: $0.audioPath) }
+		)
+		await client.deleteAudio(of: transcripts)
+
+		for url in existing {
+			#expect(!FileManager.default.fileExists(atPath: url.path))
+		}
+	}
+
+	@Test
+	func renameOrMoveItemMovesFile() throws {
+		let directory = try makeTemporaryDirectory()
+		defer { try? FileManager.default.removeItem(at: directory) }
+
+		let source = directory.appendingPathComponent("source.wav")
+		let destination = directory.appendingPathComponent("destination.wav")
+		try Data("audio".utf8).write(to: source)
+
+		try FileManager.default.renameOrMoveItem(at: source, to: destination)
+
+		#expect(!FileManager.default.fileExists(atPath: source.path))
+		#expect(try Data(contentsOf: destination) == Data("audio".utf8))
+	}
+
+	@Test
+	func renameOrMoveItemThrowsPOSIXErrorForMissingSource() throws {
+		let directory = try makeTemporaryDirectory()
+		defer { try? FileManager.default.removeItem(at: directory) }
+
+		let source = directory.appendingPathComponent("missing.wav")
+		let destination = directory.appendingPathComponent("destination.wav")
+
+		do {
+			try FileManager.default.renameOrMoveItem(at: source, to: destination)
+			Issue.record("Expected renaming a missing file to throw")
+		} catch let error as POSIXError {
+			#expect(error.code == .ENOENT)
+		}
+		#expect(!FileManager.default.fileExists(atPath: destination.path))
+	}
+
+	private func makeTemporaryDirectory() throws -> URL {
+		let url = FileManager.default.temporaryDirectory
+			.appendingPathComponent("TranscriptPersistenceClientTests-\(UUID().uuidString)", isDirectory: true)
+		try FileManager.default.createDirectory(at: url, withIntermediateDirectories: true)
+		return url
+	}
+}